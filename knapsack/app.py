@@ -1,22 +1,47 @@
 import streamlit as st
 import pandas as pd
-import os
-import json
-from subprocess import call
+import numpy as np
+import io
+from solver import solve, warm_up
 
 # --------------------------------------------------
 # Streamlit UI for the Knapsack Optimization Problem
 # --------------------------------------------------
 # This script provides a user-friendly interface to solve the knapsack problem.
 # Users can define item values, weights, and the maximum capacity of the knapsack.
-# The optimization process runs a backend script (`main.py`) and outputs results
-# as a downloadable Excel file.
+# The optimization runs in-process through the solver module (`solver.py`) and
+# outputs results as a downloadable Excel file.
 #
 # Dependencies:
-# - Python packages: streamlit, pandas, json
-# - Backend script: main.py
+# - Python packages: streamlit, pandas, numpy
+# - Solver module: solver.py
 # --------------------------------------------------
 
+# -------------------------------
+# Cached Solver
+# -------------------------------
+@st.cache_resource(show_spinner=False)
+def warm_up_solvers():
+    """
+    Compiles the solver kernels once per server process, so that the JIT
+    cost is not paid on the first click of each session.
+    """
+    warm_up()
+
+
+@st.cache_data(show_spinner=False)
+def solve_cached(capacity: int, values: np.ndarray, weights: np.ndarray, _initial_items: list = None) -> pd.DataFrame:
+    """
+    Runs the optimization for the item values and weights. Results are
+    cached on the inputs, so solving the same instance again returns
+    immediately. `_initial_items` (a previous selection used as a warm
+    start) does not change the result and is left out of the cache key.
+    """
+    return solve(capacity, values, weights, _initial_items)
+
+
+warm_up_solvers()
+
 # Title of the application
 st.title("Knapsack Optimization")
 
@@ -53,15 +78,28 @@ capacity = st.number_input("Capacité maximale du sac à dos", min_value=1, step
 # Item Details
 # -------------------------------
 st.subheader("Détails des objets")
-items = []
 
-for i in range(num_items):
-    col1, col2 = st.columns(2)
-    with col1:
-        value = st.number_input(f"Valeur de l'objet {i + 1}", key=f"value_{i}", min_value=1, step=1, format="%d")
-    with col2:
-        weight = st.number_input(f"Poids de l'objet {i + 1}", key=f"weight_{i}", min_value=1, step=1, format="%d")
-    items.append({"value": value, "weight": weight})
+# Items are edited in a single grid (one widget instead of two per item).
+# The initial table is kept in the session state for the current number of items.
+if st.session_state.get("items_df_size") != num_items:
+    st.session_state["items_df"] = pd.DataFrame(
+        {"value": [1] * num_items, "weight": [1] * num_items},
+        index=pd.RangeIndex(1, num_items + 1, name="Objet")
+    )
+    st.session_state["items_df_size"] = num_items
+
+edited = st.data_editor(
+    st.session_state["items_df"],
+    num_rows="fixed",
+    column_config={
+        "value": st.column_config.NumberColumn("Valeur", min_value=1, step=1, format="%d", required=True),
+        "weight": st.column_config.NumberColumn("Poids", min_value=1, step=1, format="%d", required=True),
+    }
+)
+
+# Items as two int64 arrays (item i at position i)
+values = edited["value"].to_numpy(dtype=np.int64)
+weights = edited["weight"].to_numpy(dtype=np.int64)
 
 
 # -------------------------------
@@ -69,57 +107,36 @@ for i in range(num_items):
 # -------------------------------
 if st.button("Lancer l'optimisation"):
     
-    # Check for duplicate items
-    items_values = [(item["value"], item["weight"]) for item in items]
-    duplicate_found = False
-    unique_items = set()
+    # Check for duplicate items (hashed in one pass by pandas)
+    duplicates = edited.duplicated(subset=["value", "weight"], keep="first")
 
-    
-    for idx, (value, weight) in enumerate(items_values):
-        if (value, weight) in unique_items:
-            st.error(f"Erreur : L'objet {idx + 1} a des valeurs identiques à un autre objet. Veuillez les modifier.")
-            duplicate_found = True
-            break
-        unique_items.add((value, weight))
-    
-    if duplicate_found:
+    if duplicates.any():
+        idx = duplicates.idxmax()  # Item number of the first duplicate (the index is 1-based)
+        st.error(f"Erreur : L'objet {idx} a des valeurs identiques à un autre objet. Veuillez les modifier.")
         st.stop()  # Stop execution if a duplicate is found
 
     with st.spinner("Exécution en cours, veuillez patienter..."):
-        # Generate input data in JSON format
-        input_data = {
-            "num_items": num_items,
-            "capacity": capacity,
-            "items": items
-        }
-
-        # Save input data as a JSON file
-        current_dir = os.path.dirname(__file__)  # Current script's directory
-        json_file_path = os.path.abspath(os.path.join(current_dir, "input.json"))
-
-        with open(json_file_path, "w") as json_file:
-            json.dump(input_data, json_file, indent=2)
-
-        # Call the main optimization script
-        main_script_path = os.path.abspath(os.path.join(current_dir, "main.py"))
-        call(['python', main_script_path, '--input', json_file_path])
-
-        # Display results
         try:
-            output_path = os.path.join(os.getcwd(), '..', 'outputs', 'chosen_items.xlsx')
-            results = pd.read_excel(output_path)
-
+            # Run the optimization in-process
+            results = solve_cached(
+                capacity,
+                values,
+                weights,
+                st.session_state.get("last_selection")
+            )
+            st.session_state["last_selection"] = results["item"].tolist()
+
+            # Display results
             if results.empty:
                 st.error("Aucun objet n'a été sélectionné. Cela signifie probablement que tous les objets dépassent la capacité maximale du sac.")
             else:
                 st.write("Objets sélectionnés :")
                 st.dataframe(results)
 
-                # Download Excel file
-                with open(output_path, "rb") as file:
-                    st.download_button("Télécharger le fichier Excel", file, file_name="results.xlsx")
+                # Download Excel file, generated in memory (xlsxwriter is faster than openpyxl)
+                buffer = io.BytesIO()
+                results.to_excel(buffer, index=False, engine="xlsxwriter")
+                st.download_button("Télécharger le fichier Excel", buffer.getvalue(), file_name="results.xlsx")
 
-        except FileNotFoundError:
-            st.error("Le fichier de résultats n'a pas été trouvé. Assurez-vous que le script d'optimisation s'est exécuté correctement.")
         except Exception as e:
-            st.error(f"Une erreur inattendue est survenue : {e}") 
\ No newline at end of file
+            st.error(f"Une erreur inattendue est survenue : {e}")
@@ -0,0 +1,164 @@
+import functools
+import numpy as np
+from numba import njit
+
+# --------------------------------------------------
+# Branch-and-Bound Solver for the 0-1 Knapsack Problem
+# --------------------------------------------------
+# This module implements the Horowitz-Sahni depth-first branch-and-bound
+# algorithm (as described by Martello & Toth). Items are sorted by
+# decreasing value/weight ratio so that the LP relaxation of any node is
+# obtained by a greedy fractional fill, which gives the upper bound used
+# to prune the search tree. The sorted arrays and their prefix sums are
+# computed once per item set (and cached), so that the bound of any node
+# reduces to a binary search instead of an O(n) fill.
+#
+# The search itself is compiled to native code with Numba and works on
+# flat int64 arrays. It can be warm-started from a known feasible
+# selection (e.g. the solution of a slightly different instance), whose
+# value then prunes the tree from the start.
+#
+# Dependencies:
+# - Python packages: numpy, numba
+# --------------------------------------------------
+
+# -----------------------------------------------
+# Compiled Search
+# -----------------------------------------------
+
+@njit(cache=True)
+def _horowitz_sahni(p, w, cum_values, cum_weights, capacity, best, best_value):
+    """
+    Runs the search on items sorted by decreasing value/weight ratio (see
+    `_sorted_items`), starting from the incumbent `best` (selection mask,
+    1 if the item is selected, 0 otherwise) of value `best_value`. Returns
+    the optimal value and selection mask in sorted order.
+    """
+    n = best.shape[0]
+
+    x = np.zeros(n + 1, dtype=np.uint8)  # Current solution
+
+    current_value = 0
+    residual = capacity
+    j = 0
+    step = 2
+
+    while True:
+        if step == 2:
+            # Upper bound: greedy fill from j (items j..r-1 fit), then a fraction
+            # of the critical item r, found by binary search on the prefix sums
+            r = np.searchsorted(cum_weights, residual + cum_weights[j], side="right") - 1
+            fill_weight = cum_weights[r] - cum_weights[j]
+            fill_value = cum_values[r] - cum_values[j]
+            # The fraction is taken in float64 (the int64 product can overflow for
+            # large values), inflated by a relative margin well above the float64
+            # rounding error so that the bound is never too low. No extra +1:
+            # nodes that can only tie the incumbent must still be pruned
+            fraction = (residual - fill_weight) * (p[r] / w[r])
+            bound = fill_value + np.int64(np.floor(fraction * (1.0 + 1e-12)))
+            step = 5 if best_value >= current_value + bound else 3
+
+        elif step == 3:
+            # Forward move: take items as long as they fit, skip the first that does not
+            while w[j] <= residual:
+                residual -= w[j]
+                current_value += p[j]
+                x[j] = 1
+                j += 1
+            if j < n:
+                x[j] = 0
+                j += 1
+            if j < n - 1:
+                step = 2
+            elif j == n - 1:
+                step = 3
+            else:
+                step = 4
+
+        elif step == 4:
+            # Leaf reached: update the incumbent
+            if current_value > best_value:
+                best_value = current_value
+                best[:] = x[:n]
+            j = n - 1
+            if x[n - 1] == 1:
+                residual += w[n - 1]
+                current_value -= p[n - 1]
+                x[n - 1] = 0
+            step = 5
+
+        else:
+            # Backtrack: drop the last selected item before j
+            i = j - 1
+            while i >= 0 and x[i] == 0:
+                i -= 1
+            if i < 0:
+                return best_value, best
+            residual += w[i]
+            current_value -= p[i]
+            x[i] = 0
+            j = i + 1
+            step = 2
+
+# -----------------------------------------------
+# Item Ordering
+# -----------------------------------------------
+
+@functools.lru_cache(maxsize=8)
+def _sorted_items(values_bytes, weights_bytes):
+    """
+    Sorts the items (given as the raw bytes of their int64 value and weight
+    arrays, which are hashable) by decreasing value/weight ratio (stable,
+    so ties keep input order). Returns the permutation, the sorted values
+    and weights followed by a sentinel item that never fits, and their
+    prefix sums (cum[k] is the sum over the first k sorted items).
+
+    The result is cached on the item set, so the arrays must not be
+    modified.
+    """
+    values = np.frombuffer(values_bytes, dtype=np.int64)
+    weights = np.frombuffer(weights_bytes, dtype=np.int64)
+
+    order = np.argsort(-(values / weights), kind="stable")
+
+    p = np.append(values[order], 0)
+    w = np.append(weights[order], np.iinfo(np.int64).max // 4)
+
+    cum_values = np.concatenate(([0], np.cumsum(p[:-1])))
+    cum_weights = np.concatenate(([0], np.cumsum(w[:-1])))
+
+    return order, p, w, cum_values, cum_weights
+
+# -----------------------------------------------
+# Public Interface
+# -----------------------------------------------
+
+def solve_knapsack(values, weights, capacity, initial_items=None):
+    """
+    Solves the 0-1 knapsack problem exactly. Returns the optimal value and
+    the 0-based indexes of the selected items, in increasing order.
+
+    `initial_items` optionally gives the 0-based indexes of a feasible
+    selection used as the starting incumbent.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+
+    if values.shape[0] == 0:
+        return 0, []
+
+    order, p, w, cum_values, cum_weights = _sorted_items(values.tobytes(), weights.tobytes())
+
+    # Starting incumbent, as a mask in sorted order
+    best = np.zeros(order.shape[0], dtype=np.uint8)
+    best_value = 0
+    if initial_items:
+        initial_items = np.unique(np.asarray(initial_items, dtype=np.int64))  # Each item counts once
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.shape[0])
+        best[rank[initial_items]] = 1
+        best_value = p[rank[initial_items]].sum()
+
+    best_value, mask = _horowitz_sahni(p, w, cum_values, cum_weights, capacity, best, best_value)
+
+    return int(best_value), sorted(order[mask == 1].tolist())
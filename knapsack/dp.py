@@ -0,0 +1,73 @@
+import numpy as np
+from numba import njit
+
+# --------------------------------------------------
+# Dynamic Programming Solver for the 0-1 Knapsack Problem
+# --------------------------------------------------
+# This module implements the classical Bellman recursion over a dense
+# int64 table of length `capacity + 1`, where dp[c] is the best value
+# reachable with a total weight of at most c. Each item is processed by a
+# Numba-compiled in-place update (no temporaries), so the runtime is
+# predictable (O(num_items * capacity)) and the solver is well suited to
+# instances with a small capacity.
+#
+# The item decisions are stored in a bit-packed matrix (one bit per
+# capacity value and item, in np.packbits layout) to recover the selected
+# items afterwards; the bits are written directly by the compiled update,
+# so no boolean row is ever materialized.
+#
+# Dependencies:
+# - Python packages: numpy, numba
+# --------------------------------------------------
+
+# -----------------------------------------------
+# Compiled Update
+# -----------------------------------------------
+
+@njit(cache=True, boundscheck=False)
+def _update(dp, keep_row, w, v):
+    """
+    Adds one item of weight w and value v to the table in place, and sets
+    in the packed `keep_row` the bits of the capacities for which the item
+    improves the value (bit c is the MSB-first bit c & 7 of byte c >> 3).
+    Capacities are visited in descending order so that dp[c - w] still
+    holds the value without the item (0-1 knapsack).
+    """
+    for c in range(dp.shape[0] - 1, w - 1, -1):
+        candidate = dp[c - w] + v
+        if candidate > dp[c]:
+            dp[c] = candidate
+            keep_row[c >> 3] |= np.uint8(0x80 >> (c & 7))
+
+# -----------------------------------------------
+# Public Interface
+# -----------------------------------------------
+
+def solve_knapsack_dp(values, weights, capacity):
+    """
+    Solves the 0-1 knapsack problem exactly. Returns the optimal value and
+    the 0-based indexes of the selected items, in increasing order.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    num_items = values.shape[0]
+
+    dp = np.zeros(capacity + 1, dtype=np.int64)
+    keep = np.zeros((num_items, (capacity + 8) // 8), dtype=np.uint8)
+
+    for i in range(num_items):
+        w = weights[i]
+        if w > capacity:
+            continue  # The item never fits
+
+        _update(dp, keep[i], w, values[i])
+
+    # Backtrack from the full capacity, reading single bits of the packed rows
+    chosen_items = []
+    c = capacity
+    for i in range(num_items - 1, -1, -1):
+        if (keep[i, c >> 3] >> (7 - (c & 7))) & 1:
+            chosen_items.append(i)
+            c -= weights[i]
+
+    return int(dp[capacity]), chosen_items[::-1]
@@ -1,118 +1,104 @@
 import os
 import sys
 import argparse
-import json
-import pandas as pd
-from pyomo.environ import *
+import orjson
+import numpy as np
+from solver import solve
 
 # --------------------------------------------------
 # Knapsack Optimization Script
 # --------------------------------------------------
-# This script solves the knapsack optimization problem using Pyomo.
-# Given a JSON file with item weights, values, and the knapsack's 
-# maximum capacity, it runs an optimization to maximize the total value 
-# of selected items without exceeding the capacity.
-# The results are saved to an Excel file that lists the selected items 
-# along with their weights and values.
+# Command line entry point for the knapsack optimization problem.
+# The knapsack data (item weights, values, and the maximum capacity) is
+# read from a JSON file and solved with the `solve` function of
+# `solver.py`. The results are saved to a CSV, Parquet or Excel file that
+# lists the selected items along with their weights and values.
 #
 # Dependencies:
-# - Python packages: pyomo, pandas, json
-# - Solver: GLPK (or another solver compatible with Pyomo)
+# - Python packages: numpy, pandas, orjson
+#   (pyarrow for Parquet output, xlsxwriter for Excel output)
+# - Solver module: solver.py
 #
 # How to use:
 # - Provide a path to a JSON input file via the `--input` argument.
-# - The script will output an Excel file in the `outputs` folder.
+# - Optionally provide the results file via the `--output` argument; its
+#   extension (.csv, .parquet or .xlsx) selects the format.
+# - By default, the script will output an Excel file in the `outputs` folder.
 # --------------------------------------------------
 
 # -----------------------------------------------
 # General Setup and Configuration
 # -----------------------------------------------
 
-# Avoid creating .pyc files
-sys.dont_write_bytecode = True
-
 # Directories setup (using relative paths for compatibility)
 root_folder_path = os.getcwd()
 outputs_folder_path = os.path.abspath(os.path.join(root_folder_path, '..', 'outputs')) # Outputs folder
 
-# Ensure the output directory exists
-if not os.path.exists(outputs_folder_path):
-    os.makedirs(outputs_folder_path)
-
-# Solver parameters
-solvername = 'glpk'  # Solver name (using GLPK as default)
-solver_path = "/usr/bin/glpsol"
+# Supported results file formats (by extension)
+output_extensions = (".csv", ".parquet", ".xlsx")
 
 # -----------------------------------------------
-# Main Optimization Function
+# Command Line Interface
 # -----------------------------------------------
 
-def main(input_file):
+def check_output_path(output_path):
     """
-    This function performs the knapsack optimization using the input data provided
-    in a JSON file. It uses the Pyomo optimization library to solve the problem.
+    Raises a ValueError if the extension of `output_path` is not a supported
+    results format, so that the error is reported before solving.
     """
-    
-    # Load data from JSON input file
-    with open(input_file, "r") as f:
-        data = json.load(f)
-
-    # Extract capacity and item data
-    max_capacity = data["capacity"]
-    items = data["items"]
+    extension = os.path.splitext(output_path)[1].lower()
+    if extension not in output_extensions:
+        raise ValueError(f"Unsupported output format: '{extension}' (expected .csv, .parquet or .xlsx)")
 
-    # Prepare data for Pyomo
-    num_items = len(items)
-    weights = {i + 1: item["weight"] for i, item in enumerate(items)}
-    values = {i + 1: item["value"] for i, item in enumerate(items)}
 
-    # Create Pyomo model
-    model = ConcreteModel()
-
-    # Define the set of items
-    model.item_indexes = RangeSet(num_items)
-
-    # Define the weight and value parameters
-    model.weight = Param(model.item_indexes, initialize=weights)
-    model.value = Param(model.item_indexes, initialize=values)
-
-    # Define the knapsack capacity
-    model.capacity = max_capacity
+def save_results(df, output_path):
+    """
+    Saves the selected items to `output_path`, in the format given by its
+    extension: CSV, Parquet or Excel (the slowest to write).
+    """
+    extension = os.path.splitext(output_path)[1].lower()
 
-    # Define decision variables (1 if the item is selected, 0 otherwise)
-    model.x = Var(model.item_indexes, domain=Binary)
+    if extension == ".csv":
+        df.to_csv(output_path, index=False)
+    elif extension == ".parquet":
+        df.to_parquet(output_path, index=False)
+    elif extension == ".xlsx":
+        df.to_excel(output_path, index=False, engine="xlsxwriter")
+    else:
+        check_output_path(output_path)
 
-    # Objective function: maximize the total value
-    model.objective = Objective(
-        expr=sum(model.value[i] * model.x[i] for i in model.item_indexes),
-        sense=maximize
-    )
 
-    # Constraint: the total weight must not exceed the capacity
-    def capacity_constraint_rule(model):
-        return sum(model.weight[i] * model.x[i] for i in model.item_indexes) <= model.capacity
-
-    model.constraint = Constraint(rule=capacity_constraint_rule)
+def main(input_file, output_path=None):
+    """
+    Command line wrapper around `solve`: reads the knapsack data from a JSON
+    file and saves the selected items to `output_path` (by default, an Excel
+    file in the outputs folder).
+    """
+    if output_path is not None:
+        check_output_path(output_path)
+    
+    # Load data from JSON input file
+    with open(input_file, "rb") as f:
+        data = orjson.loads(f.read())
 
-    # Solve the model using the specified solver
-    opt = SolverFactory(solvername, executable=solver_path, validate=False)
+    # Items as two int64 arrays (item i at position i)
+    items = data["items"]
+    values = np.fromiter((item["value"] for item in items), dtype=np.int64, count=len(items))
+    weights = np.fromiter((item["weight"] for item in items), dtype=np.int64, count=len(items))
 
-    results = opt.solve(model)
+    df = solve(data["capacity"], values, weights)
 
-    # Extract selected items
-    chosen_items = [i for i in model.item_indexes if model.x[i].value == 1]
+    if output_path is None:
+        # Ensure the output directory exists
+        if not os.path.exists(outputs_folder_path):
+            os.makedirs(outputs_folder_path)
 
-    # Prepare the results in a DataFrame
-    chosen_objects = [
-        {"item": i, "weight": weights[i], "value": values[i]} for i in chosen_items
-    ]
-    df = pd.DataFrame(chosen_objects)
+        output_path = os.path.join(outputs_folder_path, 'chosen_items.xlsx')
 
-    # Save the results to an Excel file
-    output_path = os.path.join(outputs_folder_path, 'chosen_items.xlsx')  
-    df.to_excel(output_path, index=False)
+    # Save the results
+    save_results(df, output_path)
 
-    print(f"{len(chosen_items)} items selected. Results saved to '{output_path}'.")
+    print(f"{len(df)} items selected. Results saved to '{output_path}'.")
 
 
 # -----------------------------------------------
@@ -120,11 +106,27 @@ def main(input_file):
 # -----------------------------------------------
 
 if __name__ == "__main__":
+    # Avoid creating .pyc files (only when run as a script: when imported by
+    # the app, this would disable bytecode caching for the whole process)
+    sys.dont_write_bytecode = True
+
     parser = argparse.ArgumentParser(description="Knapsack optimization script")
     parser.add_argument(
         "--input",
         required=True,
         help="Path to the input JSON file containing knapsack data"
     )
+    parser.add_argument(
+        "--output",
+        help="Path to the results file (.csv, .parquet or .xlsx); defaults to outputs/chosen_items.xlsx"
+    )
     args = parser.parse_args()
-    main(args.input)
\ No newline at end of file
+
+    # Reject an unsupported results format before loading and solving the data
+    if args.output is not None:
+        try:
+            check_output_path(args.output)
+        except ValueError as e:
+            parser.error(str(e))
+
+    main(args.input, args.output)
@@ -1,10 +0,0 @@
-using System;
-using org.gnu.glpk;
-
-class Program
-{  
-	static void Main (string[] args)
-	{
-		Console.WriteLine ("GLPK " + GLPK.glp_version ());
-	}
-}
\ No newline at end of file
@@ -1,600 +0,0 @@
-*NAME:         OIL
-*ROWS:         74
-*COLUMNS:      81
-*NONZERO:      504
-*OPT SOLN:     126.057
-*SOURCE:       Bruce Murtagh, "Advanced Linear Programming"
-*APPLICATION:  oil refinery model
-*COMMENTS:     problem is maximization
-*
-NAME          OIL REFINERY  EXAMPLE
-ROWS
- N  PROFIT
- L  MVOLBOL
- L  MVOLCOL
- E  MVOLLNC
- E  MVOLLNB
- E  MVOLSRK
- E  MVOLSRD
- E  MVOLVBB
- E  MVOLVBC
- E  MVOLRCR
- E  MVOLHVO
- E  UBALKWH
- E  UBALH2O
- E  UBALSTM
- E  UBALFUL
- E  MVOLB95
- E  MVOLB90
- E  MVOLLHG
- E  MVOLC3S
- E  MVOLNC4
- E  MVOLLSR
- E  MVOLHSR
- E  MVOLIC4
- L  VCAPSGP
- E  MVOLRFG
- E  MSCFHYL
- E  MVOLR90
- E  MVOLR95
- E  MVOLF90
- E  MVOLF95
- L  VCAPRFG
- E  MVOLLCO
- E  MVOLHHG
- E  MVOLHCD
- L  VCAPHVO
- L  VCAPHOL
- E  MVOLC3U
- E  MVOLC4U
- E  MVOLFCG
- E  MVOLSLR
- L  VCAPCCU
- E  MVOLLA3
- E  MVOLLA4
- L  VCAPALK
- L  XLPRPRE
- L  XHPRPRE
- L  XTELPRE
- L  XRVPPRE
- L  X200PRE
- L  X230PRE
- E  EVOLPRE
- L  XPSCPRE
- L  XRSCREG
- L  XLPRINT
- L  XHPRINT
- L  XTELINT
- L  XRVPINT
- L  X200INT
- L  X230INT
- E  EVOLINT
- L  XLPRREG
- L  XHPRREG
- L  XTELREG
- L  XRVPREG
- L  X200REG
- L  X230REG
- E  EVOLREG
- E  EVOLLPG
- E  EVOLJP4
- L  XRVXJP4
- L  XRVNJP4
- E  EVOLDSL
- E  EVOLRSD
- L  XVISRSD
-COLUMNS
-    VCRDBOL   MVOLBOL   1.0
-    VCRDBOL   MVOLLNB   -.537
-    VCRDBOL   MVOLSRK   -.131
-    VCRDBOL   MVOLSRD   -.1155
-    VCRDBOL   MVOLVBB   -.037
-    VCRDBOL   MVOLRCR   -.0365
-    VCRDBOL   MVOLHVO   -.143
-    VCRDBOL   UBALKWH   .302
-    VCRDBOL   UBALH2O   .150
-    VCRDBOL   UBALSTM   .003
-    VCRDBOL   UBALFUL   .0587
-    VCRDBOL   PROFIT    -12.8
-    VCRDCOL   MVOLCOL   1.
-    VCRDCOL   MVOLLNC   -.2931
-    VCRDCOL   MVOLSRK   -.1170
-    VCRDCOL   MVOLSRD   -.0649
-    VCRDCOL   MVOLVBC   -.18
-    VCRDCOL   MVOLRCR   -.1233
-    VCRDCOL   MVOLHVO   -.2217
-    VCRDCOL   UBALKWH   .384
-    VCRDCOL   UBALH2O   .185
-    VCRDCOL   UBALSTM   .003
-    VCRDCOL   UBALFUL   .1053
-    VCRDCOL   PROFIT    -11.48
-    VSGPLNC   MVOLLNC   1.
-    VSGPLNC   MVOLC3S   -.0112
-    VSGPLNC   MVOLNC4   -.0378
-    VSGPLNC   MVOLLSR   -.1502
-    VSGPLNC   MVOLHSR   -.7953
-    VSGPLNC   MVOLIC4   -.0099
-    VSGPLNC   UBALKWH   .721
-    VSGPLNC   UBALH2O   .185
-    VSGPLNC   UBALSTM   .013
-    VSGPLNC   UBALFUL   .0488
-    VSGPLNC   VCAPSGP   1.
-    VSGPLNB   MVOLLNB   1.
-    VSGPLNB   MVOLC3S   -.0277
-    VSGPLNB   MVOLNC4   -.0563
-    VSGPLNB   MVOLLSR   -.199
-    VSGPLNB   MVOLHSR   -.6873
-    VSGPLNB   MVOLIC4   -.017
-    VSGPLNB   UBALKWH   .495
-    VSGPLNB   UBALH2O   .209
-    VSGPLNB   UBALSTM   .013
-    VSGPLNB   UBALFUL   .0506
-    VSGPLNB   VCAPSGP   1.
-    VSGPLHG   MVOLLHG   1.0
-    VSGPLHG   MVOLC3S   -.175
-    VSGPLHG   MVOLNC4   -.27
-    VSGPLHG   MVOLLSR   -.028
-    VSGPLHG   MVOLIC4   -.455
-    VSGPLHG   UBALKWH   .495
-    VSGPLHG   UBALH2O   .209
-    VSGPLHG   UBALSTM   .013
-    VSGPLHG   UBALFUL   .0448
-    VSGPB95   MVOLB95   1.
-    VSGPB95   MVOLC3S   -.2836
-    VSGPB95   MVOLNC4   -.3285
-    VSGPB95   MVOLLSR   -.0241
-    VSGPB95   MVOLIC4   -.2502
-    VSGPB95   UBALKWH   .495
-    VSGPB95   UBALH2O   .209
-    VSGPB95   UBALSTM   .013
-    VSGPB95   UBALFUL   .0506
-    VSGPB90   MVOLB90   1.
-    VSGPB90   MVOLC3S   -.271
-    VSGPB90   MVOLNC4   -.3289
-    VSGPB90   MVOLLSR   -.0255
-    VSGPB90   MVOLIC4   -.2656
-    VSGPB90   UBALKWH   .495
-    VSGPB90   UBALH2O   .209
-    VSGPB90   UBALSTM   .013
-    VSGPB90   UBALFUL   .0506
-    VH2RHSR   MVOLHSR   1.
-    VH2RHSR   MVOLRFG   -1.
-    VH2RHSR   MSCFHYL   .0327
-    VH2RHSR   UBALKWH   .793
-    VH2RHSR   UBALH2O   .045
-    VH2RHSR   UBALFUL   .094
-    VH2RHSR   PROFIT    -.0176
-    VRFFRF1   MVOLRFG   1.0
-    VRFFRF1   MVOLR90   -1.0
-    VRFFRF2   MVOLRFG   1.0
-    VRFFRF2   MVOLR95   -1.0
-    VRFFHH1   MVOLR90   -1.0
-    VRFFHH1   MVOLHHG   1.0
-    VRFFHH2   MVOLR95   -1.0
-    VRFFHH2   MVOLHHG   1.0
-    VRFGR90   MVOLR90   1.0
-    VRFGR90   MVOLB90   -.0404
-    VRFGR90   MVOLF90   -0.8564
-    VRFGR90   MSCFHYL   -0.8239
-    VRFGR90   UBALKWH   .792
-    VRFGR90   UBALH2O   .297
-    VRFGR90   UBALSTM   0.0063
-    VRFGR90   UBALFUL   -0.156
-    VRFGR90   VCAPRFG   1.0
-    VRFGR90   PROFIT    -0.1512
-    VRFGR95   MVOLR95   1.0
-    VRFGR95   MVOLB95   -0.0588
-    VRFGR95   MVOLF95   -0.8145
-    VRFGR95   MSCFHYL   -.7689
-    VRFGR95   UBALKWH   1.03
-    VRFGR95   UBALH2O   .387
-    VRFGR95   UBALSTM   0.008
-    VRFGR95   UBALFUL   -.2112
-    VRFGR95   VCAPRFG   1.3
-    VRFGR95   PROFIT    -0.304
-    VHOLLCO   MVOLLCO   1.0
-    VHOLLCO   MVOLHHG   -.6627
-    VHOLLCO   MVOLLHG   -0.2414
-    VHOLLCO   MVOLHCD   -.2930
-    VHOLLCO   MSCFHYL   2.3
-    VHOLLCO   UBALFUL   -.2054
-    VHOLLCO   UBALH2O   0.826
-    VHOLLCO   UBALKWH   14.61
-    VHOLLCO   VCAPHOL   1.0
-    VHOLLCO   PROFIT    -0.2112
-    VHOLSRD   MVOLSRD   1.0
-    VHOLSRD   MVOLHHG   -.6627
-    VHOLSRD   MVOLLHG   -0.2414
-    VHOLSRD   MVOLHCD   -.2930
-    VHOLSRD   MSCFHYL   2.3
-    VHOLSRD   UBALFUL   -.2054
-    VHOLSRD   UBALH2O   0.826
-    VHOLSRD   UBALKWH   14.61
-    VHOLSRD   VCAPHOL   1.0
-    VHOLSRD   PROFIT    -0.2112
-    VHOLRCR   MVOLRCR   1.0
-    VHOLRCR   MVOLHHG   -.5875
-    VHOLRCR   MVOLLHG   -0.3321
-    VHOLRCR   MVOLHCD   -.3620
-    VHOLRCR   MSCFHYL   2.3
-    VHOLRCR   UBALFUL   -.2054
-    VHOLRCR   UBALH2O   0.826
-    VHOLRCR   UBALKWH   14.61
-    VHOLRCR   VCAPHOL   1.0
-    VHOLRCR   PROFIT    -0.2112
-    VHOLHVO   MVOLHVO   1.0
-    VHOLHVO   MVOLHHG   -.5875
-    VHOLHVO   MVOLLHG   -0.3321
-    VHOLHVO   MVOLHCD   -.3620
-    VHOLHVO   MSCFHYL   2.3
-    VHOLHVO   UBALFUL   -.2054
-    VHOLHVO   UBALH2O   0.826
-    VHOLHVO   UBALKWH   14.61
-    VHOLHVO   VCAPHVO   1.0
-    VHOLHVO   VCAPHOL   1.0
-    VHOLHVO   PROFIT    -0.2112
-    VCCUSRK   MVOLSRK   1.0
-    VCCUSRK   MVOLNC4   -0.0184
-    VCCUSRK   MVOLC3S   -0.0303
-    VCCUSRK   MVOLIC4   -0.0564
-    VCCUSRK   MVOLC3U   -0.0655
-    VCCUSRK   MVOLC4U   -0.0780
-    VCCUSRK   MVOLFCG   -0.4750
-    VCCUSRK   MVOLLCO   -0.3050
-    VCCUSRK   UBALSTM   -.0654
-    VCCUSRK   UBALFUL   -.2703
-    VCCUSRK   UBALH2O   .632
-    VCCUSRK   UBALKWH   .6807
-    VCCUSRK   VCAPCCU   1.
-    VCCUSRK   PROFIT    -.2112
-    VCCUSRD   MVOLSRD   1.
-    VCCUSRD   MVOLNC4   -.0184
-    VCCUSRD   MVOLC3S   -.0303
-    VCCUSRD   MVOLIC4   -.0564
-    VCCUSRD   MVOLC3U   -.0655
-    VCCUSRD   MVOLC4U   -.0780
-    VCCUSRD   MVOLFCG   -.4750
-    VCCUSRD   MVOLLCO   -.3050
-    VCCUSRD   UBALSTM   -.0654
-    VCCUSRD   UBALFUL   -.2703
-    VCCUSRD   UBALH2O   0.632
-    VCCUSRD   UBALKWH   .6807
-    VCCUSRD   VCAPCCU   1.
-    VCCUSRD   PROFIT    -.2112
-    VCCURCR   MVOLRCR   1.0
-    VCCURCR   MVOLNC4   -.0185
-    VCCURCR   MVOLC3S   -.0328
-    VCCURCR   MVOLIC4   -.0568
-    VCCURCR   MVOLC3U   -.0658
-    VCCURCR   MVOLC4U   -.0806
-    VCCURCR   MVOLFCG   -.4934
-    VCCURCR   MVOLLCO   -.2922
-    VCCURCR   MVOLSLR   -.0096
-    VCCURCR   UBALSTM   -.0654
-    VCCURCR   UBALFUL   -.2703
-    VCCURCR   UBALH2O   0.632
-    VCCURCR   UBALKWH   .6807
-    VCCURCR   VCAPCCU   1.
-    VCCURCR   PROFIT    -.2112
-    VCCUHVO   MVOLHVO   1.0
-    VCCUHVO   MVOLNC4   -.0185
-    VCCUHVO   MVOLC3S   -.0328
-    VCCUHVO   MVOLIC4   -.0568
-    VCCUHVO   MVOLC3U   -.0658
-    VCCUHVO   MVOLC4U   -.0806
-    VCCUHVO   MVOLFCG   -.4934
-    VCCUHVO   MVOLLCO   -.2922
-    VCCUHVO   MVOLSLR   -.0096
-    VCCUHVO   UBALSTM   -.0654
-    VCCUHVO   UBALFUL   -.2703
-    VCCUHVO   UBALH2O   0.632
-    VCCUHVO   UBALKWH   .6807
-    VCCUHVO   VCAPHVO   1.
-    VCCUHVO   VCAPCCU   1.
-    VCCUHVO   PROFIT    -.2112
-    VALKLA3   MVOLIC4   .7600
-    VALKLA3   MVOLC3U   .5714
-    VALKLA3   MVOLLA3   -1.0
-    VALKLA3   UBALSTM   .1869
-    VALKLA3   UBALFUL   .2796
-    VALKLA3   UBALH2O   2.241
-    VALKLA3   UBALKWH   2.766
-    VALKLA3   VCAPALK   1.0
-    VALKLA3   PROFIT    -.512
-    VALKLA4   MVOLIC4   .6571
-    VALKLA4   MVOLC4U   .5714
-    VALKLA4   MVOLC3S   -.0571
-    VALKLA4   MVOLNC4   -.0114
-    VALKLA4   MVOLLA4   -1.0
-    VALKLA4   UBALSTM   .1724
-    VALKLA4   UBALFUL   .2579
-    VALKLA4   UBALH2O   2.067
-    VALKLA4   UBALKWH   2.552
-    VALKLA4   VCAPALK   1.0
-    VALKLA4   PROFIT    -.472
-    VALKIC4   MVOLIC4   1.0
-    VALKIC4   MVOLNC4   -1.0
-    VALKC3U   MVOLC3U   1.0
-    VALKC3U   MVOLC3S   -1.0
-    VALKC4U   MVOLC4U   1.0
-    VALKC4U   MVOLNC4   -1.0
-    UTILC3S   MVOLC3S   1.
-    UTILC3S   UBALFUL   -3.814
-    UTILNC4   MVOLNC4   1.
-    UTILNC4   UBALFUL   -4.316
-    UTILIC4   MVOLIC4   1.
-    UTILIC4   UBALFUL   -4.153
-    UTILC3U   MVOLC3U   1.
-    UTILC3U   UBALFUL   -3.808
-    UTILC4U   MVOLC4U   1.
-    UTILC4U   UBALFUL   -4.44
-    UTILHYL   MSCFHYL   1.
-    UTILHYL   UBALFUL   -.305
-    UTILSTM   UBALSTM   -1.
-    UTILSTM   UBALFUL   1.42
-    UTILSTM   PROFIT    -.16
-    PURCPC4   MVOLIC4   -.5
-    PURCPC4   MVOLNC4   -.5
-    PURCPC4   PROFIT    -12.
-    PURCH2O   UBALH2O   -1.
-    PURCH2O   PROFIT    -.0528
-    PURCKWH   UBALKWH   -1.
-    PURCKWH   PROFIT    -.04
-    PURCFUL   UBALFUL   -1.
-    PURCFUL   PROFIT    -1.6
-    PURCFLR   UBALFUL   1.
-    BLPGC3S   MVOLC3S   1.0
-    BLPGC3S   EVOLLPG   -1.0
-    BLPGNC4   MVOLNC4   1.0
-    BLPGNC4   EVOLLPG   -1.0
-    SELLLPG   EVOLLPG   1.0
-    SELLLPG   PROFIT    11.0
-    BUP4LSR   MVOLLSR   1.0
-    BUP4LSR   EVOLJP4   -1.0
-    BUP4LSR   XRVXJP4   14.0
-    BUP4LSR   XRVNJP4   -14.0
-    BUP4HSR   MVOLHSR   1.0
-    BUP4HSR   EVOLJP4   -1.0
-    BUP4HSR   XRVXJP4   0.8
-    BUP4HSR   XRVNJP4   -0.8
-    SELLJP4   EVOLJP4   1.0
-    SELLJP4   XRVXJP4   -3.0
-    SELLJP4   XRVNJP4   2.0
-    SELLJP4   PROFIT    16.8
-    BDSLSRK   MVOLSRK   1.0
-    BDSLSRK   EVOLDSL   -1.0
-    BDSLSRD   MVOLSRD   1.0
-    BDSLSRD   EVOLDSL   -1.0
-    SELLDSL   EVOLDSL   1.0
-    SELLDSL   PROFIT    14.4
-    BPRELSR   MVOLLSR   1.
-    BPRELSR   XLPRPRE   -7.95
-    BPRELSR   XHPRPRE   -8.70
-    BPRELSR   XTELPRE   -3.00
-    BPRELSR   XRVPPRE   14.00
-    BPRELSR   X200PRE   1.
-    BPRELSR   X230PRE   -1.
-    BPRELSR   EVOLPRE   -1.
-    BPREHCD   MVOLHCD   1.0
-    BPREHCD   XLPRPRE   -8.84
-    BPREHCD   XHPRPRE   -9.45
-    BPREHCD   XTELPRE   -3.00
-    BPREHCD   XRVPPRE   12.00
-    BPREHCD   X200PRE   1.
-    BPREHCD   X230PRE   -1.
-    BPREHCD   EVOLPRE   -1.
-    BPREF95   MVOLF95   1.0
-    BPREF95   XLPRPRE   -9.43
-    BPREF95   XHPRPRE   -9.57
-    BPREF95   XTELPRE   -3.
-    BPREF95   XRVPPRE   3.5
-    BPREF95   X200PRE   .233
-    BPREF95   X230PRE   -.358
-    BPREF95   EVOLPRE   -1.
-    BPREF90   MVOLF90   1.0
-    BPREF90   XLPRPRE   -9.03
-    BPREF90   XHPRPRE   -9.32
-    BPREF90   XTELPRE   -3.0
-    BPREF90   XRVPPRE   3.5
-    BPREF90   X200PRE   .205
-    BPREF90   X230PRE   -.333
-    BPREF90   EVOLPRE   -1.
-    BPREFCG   MVOLFCG   1.0
-    BPREFCG   XLPRPRE   -9.23
-    BPREFCG   XHPRPRE   -9.22
-    BPREFCG   XTELPRE   -3.
-    BPREFCG   XRVPPRE   6.
-    BPREFCG   X200PRE   .381
-    BPREFCG   X230PRE   -.509
-    BPREFCG   EVOLPRE   -1.
-    BPRELA3   MVOLLA3   1.0
-    BPRELA3   XLPRPRE   -9.4
-    BPRELA3   XHPRPRE   -9.85
-    BPRELA3   XTELPRE   -3.0
-    BPRELA3   XRVPPRE   2.5
-    BPRELA3   X200PRE   0.39
-    BPRELA3   X230PRE   -0.77
-    BPRELA3   EVOLPRE   -1.0
-    BPRELA4   MVOLLA4   1.0
-    BPRELA4   XLPRPRE   -9.74
-    BPRELA4   XHPRPRE   -10.1
-    BPRELA4   XTELPRE   -3.0
-    BPRELA4   XRVPPRE   3.3
-    BPRELA4   X200PRE   0.233
-    BPRELA4   X230PRE   -0.58
-    BPRELA4   EVOLPRE   -1.0
-    BPRENC4   MVOLNC4   1.0
-    BPRENC4   XLPRPRE   -9.74
-    BPRENC4   XHPRPRE   -9.9
-    BPRENC4   XTELPRE   -3.0
-    BPRENC4   XRVPPRE   66.0
-    BPRENC4   X200PRE   1.0
-    BPRENC4   X230PRE   -1.0
-    BPRENC4   EVOLPRE   -1.0
-    BPRETEL   XLPRPRE   -0.493
-    BPRETEL   XHPRPRE   -0.165
-    BPRETEL   XTELPRE   1.0
-    BPRETEL   PROFIT    -0.3696
-    SELLPRE   XLPRPRE   10.03
-    SELLPRE   XHPRPRE   10.03
-    SELLPRE   XRVPPRE   -9.5
-    SELLPRE   X200PRE   -0.5
-    SELLPRE   X230PRE   0.5
-    SELLPRE   XPSCPRE   0.64
-    SELLPRE   XRSCREG   0.35
-    SELLPRE   EVOLPRE   1.0
-    SELLPRE   PROFIT    21.44
-    BINTLSR   MVOLLSR   1.0
-    BINTLSR   XLPRINT   -7.98
-    BINTLSR   XHPRINT   -8.58
-    BINTLSR   XTELINT   -3.0
-    BINTLSR   XRVPINT   14.0
-    BINTLSR   X200INT   1.0
-    BINTLSR   X230INT   -1.0
-    BINTLSR   EVOLINT   -1.0
-    BINTHCD   MVOLHCD   1.
-    BINTHCD   XLPRINT   -8.87
-    BINTHCD   XHPRINT   -9.33
-    BINTHCD   XTELINT   -3.0
-    BINTHCD   XRVPINT   12.0
-    BINTHCD   X200INT   1.0
-    BINTHCD   X230INT   -1.
-    BINTHCD   EVOLINT   -1.0
-    BINTF95   MVOLF95   1.
-    BINTF95   XLPRINT   -9.46
-    BINTF95   XHPRINT   -9.45
-    BINTF95   XTELINT   -3.0
-    BINTF95   XRVPINT   3.5
-    BINTF95   X200INT   .233
-    BINTF95   X230INT   -.358
-    BINTF95   EVOLINT   -1.0
-    BINTF90   MVOLF90   1.
-    BINTF90   XLPRINT   -9.06
-    BINTF90   XHPRINT   -9.20
-    BINTF90   XTELINT   -3.0
-    BINTF90   XRVPINT   3.5
-    BINTF90   X200INT   .205
-    BINTF90   X230INT   -.333
-    BINTF90   EVOLINT   -1.0
-    BINTFCG   MVOLFCG   1.
-    BINTFCG   XLPRINT   -9.26
-    BINTFCG   XHPRINT   -9.13
-    BINTFCG   XTELINT   -3.0
-    BINTFCG   XRVPINT   6.
-    BINTFCG   X200INT   .318
-    BINTFCG   X230INT   -.509
-    BINTFCG   EVOLINT   -1.0
-    BINTNC4   MVOLNC4   1.
-    BINTNC4   XLPRINT   -9.77
-    BINTNC4   XHPRINT   -9.78
-    BINTNC4   XTELINT   -3.0
-    BINTNC4   XRVPINT   66.
-    BINTNC4   X200INT   1.0
-    BINTNC4   X230INT   -1.
-    BINTNC4   EVOLINT   -1.0
-    BINTTEL   XLPRINT   -.435
-    BINTTEL   XHPRINT   -.208
-    BINTTEL   XTELINT   1.
-    BINTTEL   PROFIT    -.3696
-    SELLINT   XLPRINT   9.65
-    SELLINT   XHPRINT   9.65
-    SELLINT   XRVPINT   -9.5
-    SELLINT   X200INT   -0.5
-    SELLINT   X230INT   0.5
-    SELLINT   XPSCPRE   -.36
-    SELLINT   XRSCREG   0.35
-    SELLINT   EVOLINT   1.0
-    SELLINT   PROFIT    20.32
-    BREGLSR   MVOLLSR   1.0
-    BREGLSR   XLPRREG   -7.99
-    BREGLSR   XHPRREG   -8.59
-    BREGLSR   XTELREG   -3.0
-    BREGLSR   XRVPREG   14.0
-    BREGLSR   X200REG   1.0
-    BREGLSR   X230REG   -1.0
-    BREGLSR   EVOLREG   -1.0
-    BREGHCD   MVOLHCD   1.0
-    BREGHCD   XLPRREG   -8.88
-    BREGHCD   XHPRREG   -9.34
-    BREGHCD   XTELREG   -3.0
-    BREGHCD   XRVPREG   12.0
-    BREGHCD   X200REG   1.0
-    BREGHCD   X230REG   -1.0
-    BREGHCD   EVOLREG   -1.0
-    BREGF95   MVOLF95   1.0
-    BREGF95   XLPRREG   -9.47
-    BREGF95   XHPRREG   -9.46
-    BREGF95   XTELREG   -3.0
-    BREGF95   XRVPREG   3.5
-    BREGF95   X200REG   .233
-    BREGF95   X230REG   -0.358
-    BREGF95   EVOLREG   -1.0
-    BREGF90   MVOLF90   1.0
-    BREGF90   XLPRREG   -9.07
-    BREGF90   XHPRREG   -9.21
-    BREGF90   XTELREG   -3.0
-    BREGF90   XRVPREG   3.5
-    BREGF90   X200REG   .205
-    BREGF90   X230REG   -0.333
-    BREGF90   EVOLREG   -1.0
-    BREGFCG   MVOLFCG   1.0
-    BREGFCG   XLPRREG   -9.27
-    BREGFCG   XHPRREG   -9.14
-    BREGFCG   XTELREG   -3.0
-    BREGFCG   XRVPREG   6.0
-    BREGFCG   X200REG   0.318
-    BREGFCG   X230REG   -0.509
-    BREGFCG   EVOLREG   -1.0
-    BREGNC4   MVOLNC4   1.0
-    BREGNC4   XLPRREG   -9.78
-    BREGNC4   XHPRREG   -9.79
-    BREGNC4   XTELREG   -3.0
-    BREGNC4   XRVPREG   66.0
-    BREGNC4   X200REG   1.0
-    BREGNC4   X230REG   -1.0
-    BREGNC4   EVOLREG   -1.0
-    BREGTEL   XLPRREG   -0.426
-    BREGTEL   XHPRREG   -.204
-    BREGTEL   XTELREG   1.0
-    BREGTEL   PROFIT    -0.3696
-    SELLREG   XLPRREG   9.05
-    SELLREG   XHPRREG   9.05
-    SELLREG   XRVPREG   -9.5
-    SELLREG   X200REG   -0.5
-    SELLREG   X230REG   0.5
-    SELLREG   XPSCPRE   -0.36
-    SELLREG   XRSCREG   -0.65
-    SELLREG   EVOLREG   1.0
-    SELLREG   PROFIT    18.04
-    BRSDVBB   MVOLVBB   1.0
-    BRSDVBB   EVOLRSD   -1.0
-    BRSDVBB   XVISRSD   10.1
-    BRSDVBC   MVOLVBC   1.0
-    BRSDVBC   EVOLRSD   -1.0
-    BRSDVBC   XVISRSD   12.63
-    BRSDRCR   MVOLRCR   1.0
-    BRSDRCR   EVOLRSD   -1.0
-    BRSDRCR   XVISRSD   6.9
-    BRSDHVO   MVOLHVO   1.0
-    BRSDHVO   EVOLRSD   -1.0
-    BRSDHVO   XVISRSD   8.05
-    BRSDHVO   VCAPHVO   1.0
-    BRSDSLR   MVOLSLR   1.0
-    BRSDSLR   EVOLRSD   -1.0
-    BRSDSLR   XVISRSD   8.05
-    BRSDLCO   MVOLLCO   1.0
-    BRSDLCO   EVOLRSD   -1.0
-    BRSDLCO   XVISRSD   4.4
-    SELLRSD   EVOLRSD   1.0
-    SELLRSD   XVISRSD   -10.1
-    SELLRSD   PROFIT    8.00
-RHS
-    LIMITMAX  MVOLBOL   26.316
-    LIMITMAX  MVOLCOL   21.052
-    LIMITMAX  VCAPSGP   23.25
-    LIMITMAX  VCAPHVO   5.25
-    LIMITMAX  VCAPRFG   13.455
-    LIMITMAX  VCAPHOL   3.87
-    LIMITMAX  VCAPCCU   7.26
-    LIMITMAX  VCAPALK   10.
-ENDATA
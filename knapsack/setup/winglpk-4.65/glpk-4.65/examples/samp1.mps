@@ -1,29 +0,0 @@
-NAME          SAMP1
-ROWS
- N  Z
- G  R1
- G  R2
- G  R3
-COLUMNS
-    X1        R1                2.0    R2                 1.0
-    X1        R3                5.0    Z                  3.0
-    MARK0001  'MARKER'                 'INTORG'
-    X2        R1               -1.0    R2                -1.0
-    X2        R3                3.0    Z                  7.0
-    X3        R1                1.0    R2                -6.0
-    X3        Z                -1.0
-    MARK0002  'MARKER'                 'INTEND'
-    X4        R1               -1.0    R2                 4.0
-    X4        R3                1.0    Z                  1.0
-RHS
-    RHS1      R1                1.0
-    RHS1      R2                8.0
-    RHS1      R3                5.0
-BOUNDS
- UP BND1      X1                4.0
- LO BND1      X2                2.0
- UP BND1      X2                5.0
- UP BND1      X3                1.0
- LO BND1      X4                3.0
- UP BND1      X4                8.0
-ENDATA
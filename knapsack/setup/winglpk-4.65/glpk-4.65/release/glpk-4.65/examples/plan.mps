@@ -1,54 +0,0 @@
-*000000001111111111222222222233333333334444444444555555555566
-*234567890123456789012345678901234567890123456789012345678901
-NAME          PLAN
-ROWS
- N  VALUE
- E  YIELD
- L  FE
- L  CU
- L  MN
- L  MG
- G  AL
- L  SI
-COLUMNS
-    BIN1      VALUE           .03000   YIELD          1.00000
-              FE              .15000   CU              .03000
-              MN              .02000   MG              .02000
-              AL              .70000   SI              .02000
-    BIN2      VALUE           .08000   YIELD          1.00000
-              FE              .04000   CU              .05000
-              MN              .04000   MG              .03000
-              AL              .75000   SI              .06000
-    BIN3      VALUE           .17000   YIELD          1.00000
-              FE              .02000   CU              .08000
-              MN              .01000   AL              .80000
-              SI              .08000
-    BIN4      VALUE           .12000   YIELD          1.00000
-              FE              .04000   CU              .02000
-              MN              .02000   AL              .75000
-              SI              .12000
-    BIN5      VALUE           .15000   YIELD          1.00000
-              FE              .02000   CU              .06000
-              MN              .02000   MG              .01000
-              AL              .80000   SI              .02000
-    ALUM      VALUE           .21000   YIELD          1.00000
-              FE              .01000   CU              .01000
-              AL              .97000   SI              .01000
-    SILICON   VALUE           .38000   YIELD          1.00000
-              FE              .03000   SI              .97000
-RHS
-    RHS1      YIELD       2000.00000   FE            60.00000
-              CU           100.00000   MN            40.00000
-              SI           300.00000
-              MG            30.00000   AL          1500.00000
-RANGES
-    RNG1      SI            50.00000
-BOUNDS
- UP BND1      BIN1         200.00000
- UP           BIN2        2500.00000
- LO           BIN3         400.00000
- UP           BIN3         800.00000
- LO           BIN4         100.00000
- UP           BIN4         700.00000
- UP           BIN5        1500.00000
-ENDATA
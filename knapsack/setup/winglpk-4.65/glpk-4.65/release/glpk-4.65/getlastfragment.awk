@@ -1,6 +0,0 @@
-# split path and extract last part
-{
-n = split($1,parts,"/");
-print(parts[n]);
-exit;
-}
@@ -1,19 +0,0 @@
-/* 
- * File:   mainpage.cs
- * This file is used for generating the Doxygen documentation main page.
- * 
- * Copyright 2015 Heinrich Schuchardt <xypron.glpk@gmx.de>
- */
-
-/** \mainpage notitle
- *
- * \section intro_sec Introduction
- *
- * GLPK for C#/CLI provides a common language interface binding for the
- * GLPK linear programming library. It allows you to use the Gnu Linear
- * Programming Kit with all .NET/Mono languages
- * (C#, F#, Python, J#, Scala, Visual Basic, ...).
- *
- * \section License
- * \verbinclude COPYING
- */
@@ -1 +0,0 @@
-#define TLS __declspec(thread)
@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+from bnb import solve_knapsack
+from dp import solve_knapsack_dp
+
+# --------------------------------------------------
+# Knapsack Solver
+# --------------------------------------------------
+# This module solves the knapsack optimization problem in-process.
+# Given item weights, values, and the knapsack's maximum capacity, it
+# runs a dedicated solver to select the most valuable items that fit:
+# dynamic programming (`dp.py`) when the capacity is small enough, and
+# branch-and-bound (`bnb.py`) otherwise. The `solve` function is used
+# directly by the Streamlit app and by the command line script (`main.py`).
+#
+# Items are passed as two int64 NumPy arrays (values and weights, item i
+# being at position i) rather than one Python object per item.
+#
+# Dependencies:
+# - Python packages: numpy, numba, pandas
+# - Solver modules: bnb.py, dp.py
+# --------------------------------------------------
+
+# -----------------------------------------------
+# General Setup and Configuration
+# -----------------------------------------------
+
+# Solver parameters
+dp_max_cells = 10_000_000  # Largest num_items * capacity solved by dynamic programming
+
+# -----------------------------------------------
+# Preprocessing
+# -----------------------------------------------
+
+def reduce_items(weights, capacity):
+    """
+    Returns the indexes of the items that can be part of a solution, i.e.
+    whose weight does not exceed the capacity.
+
+    Value dominance (dropping an item when a lighter one is worth at least
+    as much) is not applied: it is only valid when items can be taken
+    several times, whereas here both items may belong to the optimum.
+    """
+    return np.flatnonzero(weights <= capacity)
+
+def warm_start(initial_items, candidates, candidate_weights, capacity):
+    """
+    Maps a previous selection (1-based item numbers) to positions among the
+    candidate items. Returns None if there is no selection or if it is not
+    feasible for the current instance.
+    """
+    if not initial_items:
+        return None
+
+    previous = np.unique(np.asarray(initial_items, dtype=np.int64) - 1)
+    if not np.isin(previous, candidates).all():
+        return None  # Unknown item, or one that no longer fits
+
+    # Candidates are sorted, so positions are found by binary search
+    initial = np.searchsorted(candidates, previous)
+
+    if candidate_weights[initial].sum() > capacity:
+        return None
+
+    return initial.tolist()
+
+# -----------------------------------------------
+# Main Optimization Function
+# -----------------------------------------------
+
+def solve(capacity, values, weights, initial_items=None):
+    """
+    This function performs the knapsack optimization for the given item
+    values and weights (int64 arrays of the same length) and returns the
+    selected items as a DataFrame with the columns item (1-based), weight
+    and value.
+
+    `initial_items` optionally gives the item numbers (1-based) of a
+    previous solution, e.g. before the user tweaked one item. If it is
+    still feasible, it warm-starts the branch-and-bound solver.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+
+    # Only solve over the items that fit on their own
+    candidates = reduce_items(weights, capacity)
+    candidate_weights = weights[candidates]
+    candidate_values = values[candidates]
+
+    if candidate_weights.sum() <= capacity:
+        # Everything fits: no optimization needed
+        chosen_items = candidates
+    else:
+        # Dense DP has a predictable cost on small tables, branch-and-bound otherwise
+        if len(candidates) * capacity <= dp_max_cells:
+            _, chosen = solve_knapsack_dp(candidate_values, candidate_weights, capacity)
+        else:
+            _, chosen = solve_knapsack(
+                candidate_values, candidate_weights, capacity,
+                warm_start(initial_items, candidates, candidate_weights, capacity)
+            )
+        chosen_items = candidates[np.asarray(chosen, dtype=np.int64)]
+
+    # Prepare the results in a DataFrame
+    return pd.DataFrame({
+        "item": chosen_items + 1,
+        "weight": weights[chosen_items],
+        "value": values[chosen_items],
+    })
+
+
+def warm_up():
+    """
+    Runs both solvers on a tiny instance so that their Numba kernels are
+    compiled (or loaded from the on-disk cache) before the first real solve.
+    """
+    values = np.array([2, 1], dtype=np.int64)
+    weights = np.array([2, 1], dtype=np.int64)
+
+    solve_knapsack_dp(values, weights, 2)
+    solve_knapsack(values, weights, 2)
@@ -0,0 +1,58 @@
+import time
+import numpy as np
+from bnb import solve_knapsack
+from solver import solve
+
+# --------------------------------------------------
+# Branch-and-Bound Solver Regression Tests
+# --------------------------------------------------
+# Run with `python -m pytest` from the knapsack folder.
+# --------------------------------------------------
+
+def test_large_values_do_not_overflow_bound():
+    """
+    Values around 1e11 and weights around 1e9: the fractional bound used
+    to overflow int64 and prune the optimal branch.
+    """
+    values = [65443258188, 145348444545, 249577422532, 548313828240]
+    weights = [107397716, 232201138, 800296773, 761221762]
+    capacity = 1646989583
+
+    best_value, chosen = solve_knapsack(values, weights, capacity)
+
+    assert best_value == 797891250772
+    assert sum(weights[i] for i in chosen) <= capacity
+    assert sum(values[i] for i in chosen) == best_value
+
+    results = solve(capacity, np.array(values), np.array(weights))
+    assert results["value"].sum() == 797891250772
+
+
+def test_warm_start_ignores_repeated_items():
+    """
+    A repeated index in the warm start must not count the item's value twice.
+    """
+    assert solve_knapsack([5, 3], [2, 2], 3, [0, 0]) == (5, [0])
+
+
+def test_equal_ratios_are_pruned():
+    """
+    With every item at the same value/weight ratio, most nodes can only tie
+    the incumbent; they must be pruned, or the search becomes exponential.
+    """
+    rng = np.random.default_rng(0)
+    weights = rng.integers(900_000, 1_100_000, size=300)
+    values = 2 * weights
+    capacity = int(weights.sum() // 2)
+
+    solve_knapsack(values[:3], weights[:3], capacity)  # Compile outside the timing
+
+    start = time.perf_counter()
+    best_value, chosen = solve_knapsack(values, weights, capacity)
+    elapsed = time.perf_counter() - start
+
+    # Optimal: the total value is twice the weight, so it is bounded by 2 * capacity
+    assert sum(weights[i] for i in chosen) <= capacity
+    assert best_value == sum(values[i] for i in chosen)
+    assert best_value == 2 * capacity
+    assert elapsed < 0.5